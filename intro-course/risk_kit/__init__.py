@@ -0,0 +1,8 @@
+"""
+Risk and portfolio construction toolkit shared by the weekly notebooks
+    - core: data loaders and risk statistics (drawdowns, VaR, moments)
+    - portfolio: returns, volatility and efficient frontier optimization
+The notebooks keep importing their week's module (week-1/edhec_risk_kit.py,
+week-2/risk_toolkit.py, week-3/risk_toolkit.py), which puts intro-course on
+sys.path and re-exports the public names of these modules
+"""
@@ -0,0 +1,445 @@
+import os
+import functools
+import hashlib
+import tempfile
+import pandas as pd 
+import numpy as np
+
+__all__ = [
+    'drawdown', 'max_drawdown', 'drawdown_fast',
+    'get_ffme_returns', 'get_hfi_returns', 'get_ind_returns', 'get_ind_size', 'get_ind_nfirms',
+    'semideviation', 'var_historic', 'var_gaussian', 'cvar_historic',
+    'skewness', 'kurtosis', 'is_normal',
+]
+
+# the CSV files are shared by every week of the course
+_DATA_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'data')
+
+
+def _lazy_njit(fallback):
+    """
+    Decorator for a loop kernel: numba is imported and the kernel compiled on the
+    first call, so importing the toolkit doesn't pay for numba.
+    Without numba installed, the numpy "fallback" is used instead
+    """
+    def decorator(loop_func):
+        compiled = []
+        @functools.wraps(loop_func)
+        def kernel(*args):
+            if not compiled:
+                try:
+                    from numba import njit
+                    compiled.append(njit(cache=True, fastmath=True)(loop_func))
+                except ImportError:
+                    compiled.append(fallback)
+            return compiled[0](*args)
+        return kernel
+    return decorator
+
+
+def drawdown(return_series: pd.Series):
+    """
+    Takes a times series of asset returns
+    Computes and returns a DataFrame that contains:
+        - the  wealth index
+        - the previous peaks
+        - percent drawdowns
+    """
+    returns = np.asarray(return_series, dtype=np.float64)
+    # like pandas' cumprod and cummax, skip missing returns instead of
+    # letting them turn every later value into NaN
+    missing = np.isnan(returns)
+    # accumulate in place, so the only allocations are the three output columns
+    wealth_index = np.add(1.0, returns)
+    wealth_index[missing] = 1.0
+    np.cumprod(wealth_index, axis=0, out=wealth_index)
+    wealth_index *= 1000
+    previous_peaks = np.maximum.accumulate(wealth_index, axis=0)
+    drawdowns = np.subtract(wealth_index, previous_peaks)
+    drawdowns /= previous_peaks
+    if missing.any():
+        wealth_index[missing] = previous_peaks[missing] = drawdowns[missing] = np.nan
+    return pd.DataFrame({
+        'Wealth'    : wealth_index,
+        'Peaks'     : previous_peaks,
+        'Drawdown' : drawdowns
+    }, index=return_series.index)
+
+def max_drawdown(r):
+    """
+    Returns the maximum drawdown of r (a negative number) without
+    building the wealth index and peaks as a DataFrame
+    r must be a Series or a DataFrame
+    """
+    returns = np.asarray(r, dtype=np.float64)
+    missing = np.isnan(returns)
+    wealth_index = np.add(1.0, returns)
+    # skip missing returns, as drawdown() does
+    wealth_index[missing] = 1.0
+    np.cumprod(wealth_index, axis=0, out=wealth_index)
+    previous_peaks = np.maximum.accumulate(wealth_index, axis=0)
+    # reuse wealth_index for the drawdowns
+    wealth_index -= previous_peaks
+    wealth_index /= previous_peaks
+    max_dd = np.where(missing.all(axis=0), np.nan, wealth_index.min(axis=0))
+    if isinstance(r, pd.DataFrame):
+        return pd.Series(max_dd, index=r.columns)
+    return float(max_dd)
+
+def _drawdown_numpy(returns, wealth, peak):
+    """
+    Drawdowns starting from the given wealth and peak, with numpy accumulators
+    """
+    if returns.size == 0:
+        return np.empty(0), wealth, peak
+    wealth_index = wealth * np.cumprod(1 + returns)
+    previous_peaks = np.maximum(np.maximum.accumulate(wealth_index), peak)
+    drawdowns = (wealth_index - previous_peaks) / previous_peaks
+    return drawdowns, wealth_index[-1], previous_peaks[-1]
+
+@_lazy_njit(_drawdown_numpy)
+def _drawdown_kernel(returns, wealth, peak):
+    """
+    Single sweep over the returns carrying only the running wealth and peak
+    """
+    drawdowns = np.empty(returns.size)
+    for i in range(returns.size):
+        wealth *= 1.0 + returns[i]
+        if wealth > peak:
+            peak = wealth
+        drawdowns[i] = (wealth - peak) / peak
+    return drawdowns, wealth, peak
+
+def drawdown_fast(return_series, wealth=1000.0, peak=0.0):
+    """
+    Takes a times series of asset returns
+    Returns the percent drawdowns as an ndarray, plus the final wealth and peak
+    Feed the returned wealth and peak back in with the next returns to update
+    the drawdowns without recomputing them over the whole history
+    """
+    returns = np.ascontiguousarray(return_series, dtype=np.float64)
+    # skip missing returns, as drawdown() does
+    missing = np.isnan(returns)
+    if missing.any():
+        returns = np.where(missing, 0.0, returns)
+    drawdowns, wealth, peak = _drawdown_kernel(returns, float(wealth), float(peak))
+    drawdowns[missing] = np.nan
+    return drawdowns, wealth, peak
+
+def _read_csv_cached(file, **kwargs):
+    """
+    pd.read_csv() that only parses the CSV the first time: the parsed frame
+    is cached in memory and in a parquet file next to the CSV, and both caches
+    are refreshed whenever the CSV is modified
+    """
+    return _load_csv(file, os.path.getmtime(file), **kwargs).copy()
+
+@functools.lru_cache(maxsize=None)
+def _load_csv(file, mtime, **kwargs):
+    # the parse options are part of the cache file name, so reading the same
+    # CSV with different options never returns the other read's frame
+    options = hashlib.md5(repr(sorted(kwargs.items())).encode()).hexdigest()[:8]
+    cache_file = '%s.%s.parquet' % (os.path.splitext(file)[0], options)
+    try:
+        if os.path.getmtime(cache_file) >= mtime:
+            return pd.read_parquet(cache_file)
+    except Exception:
+        # no cache yet, no parquet engine installed, or an unreadable cache file
+        pass
+    df = pd.read_csv(file, **kwargs)
+    # write to a temporary file and move it into place, so an interrupted
+    # write never leaves a truncated cache file behind
+    tmp_file = None
+    try:
+        fd, tmp_file = tempfile.mkstemp(suffix='.tmp', dir=os.path.dirname(cache_file))
+        os.close(fd)
+        df.to_parquet(tmp_file)
+        os.replace(tmp_file, cache_file)
+    except Exception:
+        # the cache is best effort, e.g. the data directory may be read-only
+        if tmp_file is not None and os.path.exists(tmp_file):
+            os.remove(tmp_file)
+    return df
+
+def _yyyymm_to_period(index):
+    """
+    Converts an index of YYYYMM integers to a monthly PeriodIndex
+    with integer arithmetic instead of parsing every value as a date
+    """
+    yyyymm = np.asarray(index, dtype=np.int64)
+    return pd.PeriodIndex.from_fields(year=yyyymm // 100, month=yyyymm % 100, freq='M')
+
+def get_ffme_returns():
+    """"
+    Load the Fama-French Dataset for the returns of the
+    Top ans Bottom Deciles by MarketCap
+    """
+    me_m = _read_csv_cached(
+        os.path.join(_DATA_DIR, "Portfolios_Formed_on_ME_monthly_EW.csv"),
+        header=0, index_col=0, na_values=-99.99
+    )
+    rets = me_m[['Lo 10', 'Hi 10']]
+    rets.columns = ['SmallCap', 'LargeCap']
+    rets /= 100
+    rets.index = _yyyymm_to_period(rets.index)
+    return rets
+
+def get_hfi_returns():
+    """
+    Load and format the EDHEC Hedge Fund Index Returns
+    """
+    hfi = _read_csv_cached(
+        os.path.join(_DATA_DIR, "edhec-hedgefundindices.csv"),
+        header=0, index_col=0, parse_dates=True
+    )
+    hfi /= 100
+    hfi.index = hfi.index.to_period('M')
+    return hfi
+
+def get_ind_returns():
+    """
+    Load and format the Ken French 30 Industry Portfolios Value Weighted Monthly Returns
+    """
+    file = os.path.join(_DATA_DIR, 'ind30_m_vw_rets.csv')
+    ind = _read_csv_cached(file, header=0, index_col=0, parse_dates=True) / 100
+    ind.index = _yyyymm_to_period(ind.index)
+    ind.columns = ind.columns.str.strip()
+    return ind
+
+def get_ind_size():
+    """
+    """
+    file = os.path.join(_DATA_DIR, 'ind30_m_size.csv')
+    ind = _read_csv_cached(file, header=0, index_col=0, parse_dates=True)
+    ind.index = _yyyymm_to_period(ind.index)
+    ind.columns = ind.columns.str.strip()
+    return ind
+
+def get_ind_nfirms():
+    """
+    """
+    file = os.path.join(_DATA_DIR, 'ind30_m_nfirms.csv')
+    ind = _read_csv_cached(file, header=0, index_col=0, parse_dates=True)
+    ind.index = _yyyymm_to_period(ind.index)
+    ind.columns = ind.columns.str.strip()
+    return ind
+
+def semideviation(r):
+    """
+    Returns the semideviation aka negative semideviation of r
+    r must be a Series or a DataFrame
+    """
+    arr = _as_columns(r)
+    is_negative = arr < 0
+    negatives = np.where(is_negative, arr, 0.0)
+    # population std of the negative returns from their first two raw moments
+    with np.errstate(invalid='ignore', divide='ignore'):
+        n_neg = is_negative.sum(axis=0)
+        mean = negatives.sum(axis=0) / n_neg
+        mean_sq = (negatives * negatives).sum(axis=0) / n_neg
+    return _from_columns(np.sqrt(np.maximum(mean_sq - mean*mean, 0.0)), r)
+
+def _percentile_partition(arr, level, axis=0):
+    """
+    Same result as np.percentile(arr, level, axis) with linear interpolation,
+    but selects the two order statistics with np.partition instead of sorting
+    """
+    if not 0 <= level <= 100:
+        raise ValueError("level must be in the range [0, 100]")
+    arr = np.asarray(arr, dtype=np.float64)
+    n = arr.shape[axis]
+    pos = level / 100 * (n - 1)
+    k = int(np.floor(pos))
+    frac = pos - k
+    if frac == 0:
+        result = np.take(np.partition(arr, k, axis=axis), k, axis=axis)
+    else:
+        part = np.partition(arr, (k, k + 1), axis=axis)
+        lo = np.take(part, k, axis=axis)
+        hi = np.take(part, k + 1, axis=axis)
+        result = lo + frac * (hi - lo)
+    # np.partition sorts NaNs to the end but they still count in n,
+    # so return NaN for them like np.percentile does
+    return np.where(np.isnan(arr).any(axis=axis), np.nan, result)
+
+def _as_columns(r):
+    """
+    Returns the values of a Series or DataFrame as a 2-D float64 array,
+    one column per Series
+    """
+    if isinstance(r, pd.DataFrame):
+        return np.asarray(r.values, dtype=np.float64)
+    elif isinstance(r, pd.Series):
+        return np.asarray(r.values, dtype=np.float64).reshape(-1, 1)
+    else:
+        raise TypeError("Expected r to be Series or DataFrame")
+
+def _from_columns(values, r):
+    """
+    Wraps per-column results the way r was shaped:
+    a Series for a DataFrame and a float for a Series
+    """
+    if isinstance(r, pd.DataFrame):
+        return pd.Series(values, index=r.columns)
+    return values[0]
+
+def _var_historic_nd(arr, level):
+    """
+    Historic VaR of each column of the 2-D array arr
+    """
+    return -_percentile_partition(arr, level, axis=0)
+
+def var_historic(r, level=5):
+    """
+    Returns the historic Value at Risk at a specified level
+    i.e. returns the number such that "level" percent of the returns
+    fall bellow that number, and the (100 - level) percent are above
+    """
+    return _from_columns(_var_historic_nd(_as_columns(r), level), r)
+
+
+@functools.lru_cache(maxsize=32)
+def _z_from_level(level):
+    """
+    Z score of the standard normal at "level" percent, memoized because
+    the same few levels are asked for over and over
+    """
+    # scipy.stats (and the scipy.optimize it pulls in) is imported on first use
+    import scipy.stats
+    return float(scipy.stats.norm.ppf(level/100))
+
+def _cornish_fisher_z_numpy(z, s, k):
+    """
+    Cornish-Fisher adjusted Z score for arrays of skewness and kurtosis
+    """
+    z2 = z * z
+    z3 = z2 * z
+    return z + (z2 - 1)*s/6 + (z3 - 3*z)*(k - 3)/24 + (2*z3 - 5*z)*(s*s)/36
+
+@_lazy_njit(_cornish_fisher_z_numpy)
+def _cornish_fisher_z(z, s, k):
+    """
+    Cornish-Fisher adjusted Z score for arrays of skewness and kurtosis,
+    fused into one loop so no temporary arrays are allocated
+    """
+    z2 = z * z
+    z3 = z2 * z
+    out = np.empty_like(s)
+    for i in range(s.size):
+        out[i] = (z + (z2 - 1)*s[i]/6 + (z3 - 3*z)*(k[i] - 3)/24
+                  + (2*z3 - 5*z)*(s[i]*s[i])/36)
+    return out
+
+def var_gaussian(r, level=5, modified=False):
+    """"
+    Returns the Parametric Gaussian VaR of a Series or DataFrame
+    If "modified" is True, then the modified VaR is returned,
+    using the Cornish-Fisher modification
+    """
+    # skewness and kurtosis need the higher moments, the plain VaR doesn't
+    moments = _central_moments(r, order=4 if modified else 2)
+    mean, m2 = moments[0], moments[1]
+    # Compute the Z score assuming it was Gaussian
+    z = _z_from_level(level)
+    if modified:
+        # Modify the Z score based on observed skewness and kurtosis
+        s = skewness(r, moments=moments)
+        k = kurtosis(r, moments=moments)
+        z = _cornish_fisher_z(
+            z,
+            np.atleast_1d(np.asarray(s, dtype=np.float64)),
+            np.atleast_1d(np.asarray(k, dtype=np.float64))
+        )
+        z = pd.Series(z, index=r.columns) if isinstance(r, pd.DataFrame) else z[0]
+    return - (mean + z * m2**0.5)
+
+def _cvar_historic_nd(arr, level):
+    """
+    Historic Conditional VaR of each column of the 2-D array arr
+    """
+    is_beyond = arr <= -_var_historic_nd(arr, level)
+    sums = np.where(is_beyond, arr, 0.0).sum(axis=0)
+    # columns with missing returns have a NaN VaR, so nothing is beyond it
+    with np.errstate(invalid='ignore'):
+        return -sums / is_beyond.sum(axis=0)
+
+def cvar_historic(r, level=5):
+    """
+    Computes the Conditional VaR of Series or DataFrame
+    """
+    return _from_columns(_cvar_historic_nd(_as_columns(r), level), r)
+
+def _central_moments(r, order=4):
+    """
+    Computes the mean and the central moments up to "order" (2 or 4)
+    of the supplied Series or DataFrame in a single pass
+    Missing values are skipped, like the pandas reductions do
+    Returns a tuple of floats or a tuple of Series
+    """
+    arr = np.asarray(r, dtype=np.float64)
+    missing = np.isnan(arr)
+    has_missing = missing.any()
+    if has_missing:
+        count = (~missing).sum(axis=0)
+        arr = np.where(missing, 0.0, arr)
+    else:
+        count = arr.shape[0]
+    with np.errstate(invalid='ignore', divide='ignore'):
+        mean = arr.sum(axis=0) / count
+        demeaned_r = arr - mean
+        if has_missing:
+            demeaned_r[missing] = 0.0
+        sq = demeaned_r * demeaned_r
+        # population moments, i.e. dof=0
+        moments = [mean, sq.sum(axis=0) / count]
+        if order > 2:
+            moments.append((sq * demeaned_r).sum(axis=0) / count)
+            moments.append((sq * sq).sum(axis=0) / count)
+    if isinstance(r, pd.DataFrame):
+        return tuple(pd.Series(m, index=r.columns) for m in moments)
+    return tuple(moments)
+
+def skewness(r, moments=None):
+    """
+    Alternative to scipy.stats.skew()
+    Computes the skewness of the supplied Series or DataFrame
+    "moments" can be a precomputed result of _central_moments(r)
+    Returns a float or a Series
+    """
+    if moments is None:
+        moments = _central_moments(r)
+    m2, m3 = moments[1], moments[2]
+    return m3 / m2**1.5
+
+
+def kurtosis(r, moments=None):
+    """
+    Alternative to scipy.stats.kurtosis()
+    Computes the kurtosis of the supplied Series or DataFrame
+    "moments" can be a precomputed result of _central_moments(r)
+    Returns a float or a Series
+    """
+    if moments is None:
+        moments = _central_moments(r)
+    m2, m4 = moments[1], moments[3]
+    return m4 / m2**2
+
+def is_normal(r, level=0.01):
+    """
+    Aplies the Jarque-Bera test to determine if a Series is normal or not
+    Test is applied at the 1% level by default
+    Returns True if the hypothesis of normality is accepted, False otherwise
+    For a DataFrame the test is applied to each column and a Series is returned
+    """
+    # same statistic as scipy.stats.jarque_bera, reusing our own moments
+    moments = _central_moments(r)
+    s = skewness(r, moments=moments)
+    k = kurtosis(r, moments=moments)
+    # the moments skip missing values, so the sample size has to as well
+    n = (~np.isnan(np.asarray(r, dtype=np.float64))).sum(axis=0)
+    statistic = n/6 * (s**2 + (k - 3)**2/4)
+    import scipy.stats
+    p_value = scipy.stats.chi2.sf(statistic, 2)
+    if isinstance(r, pd.DataFrame):
+        return pd.Series(p_value > level, index=r.columns)
+    return p_value > level
@@ -0,0 +1,366 @@
+import functools
+import numpy as np
+import pandas as pd
+
+__all__ = [
+    'annualize_rets', 'annualize_vol', 'sharpe_ratio',
+    'portfolio_return', 'portfolio_vol', 'plot_ef2',
+    'minimize_vol', 'optimal_weights', 'gmv', 'plot_ef', 'msr',
+]
+
+
+def annualize_rets(r, periods_per_year):
+    """
+    Annualizes a set of returns
+    """
+    compound_growth = (1 + r).prod()
+    n_periods = r.shape[0]
+    return compound_growth**(periods_per_year/n_periods) - 1
+
+def annualize_vol(r, periods_per_year):
+    """
+    Annualizes the vol of a set of returns
+    """
+    return r.std() * (periods_per_year**0.5)
+
+def sharpe_ratio(r, riskfree_rate, periods_per_year):
+    """
+    Computes the annualized sharpe ratio of a set of returns
+    """
+    rf_per_period = ((1 + riskfree_rate)**(1/periods_per_year)) - 1
+    # like annualize_rets and annualize_vol, accept arrays as well as pandas objects
+    arr = np.asarray(r, dtype=np.float64)
+    if arr.ndim == 1:
+        arr = arr.reshape(-1, 1)
+    # missing returns are skipped in the sums, as the pandas reductions do
+    n_returns = (~np.isnan(arr)).sum(axis=0)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        # same as annualize_rets on the excess returns, compounded as a sum of logs
+        # and annualized over every period, missing or not
+        log_growth = np.nansum(np.log1p(arr - rf_per_period), axis=0)
+        ann_ex_ret = np.expm1(log_growth * periods_per_year/arr.shape[0])
+        # same as annualize_vol, i.e. the sample standard deviation
+        demeaned_r = arr - np.nansum(arr, axis=0) / n_returns
+        var = np.nansum(demeaned_r * demeaned_r, axis=0) / (n_returns - 1)
+        ann_vol = np.sqrt(var * periods_per_year)
+        sharpe = ann_ex_ret / ann_vol
+    if isinstance(r, pd.DataFrame):
+        return pd.Series(sharpe, index=r.columns)
+    return sharpe[0] if np.ndim(r) == 1 else sharpe
+
+def _as_array(x, dtype=None):
+    """
+    Returns x as a contiguous ndarray, so the optimizer loops below
+    don't pay pandas overhead on every evaluation
+    Without a dtype, float32 data stays float32 and anything else becomes float64
+    """
+    x = np.asarray(x)
+    if dtype is None:
+        dtype = x.dtype if x.dtype in (np.float32, np.float64) else np.float64
+    return np.ascontiguousarray(x, dtype=dtype)
+
+def portfolio_return(weights, returns):
+    """
+    Weights -> Retunrns
+    """
+    return np.dot(weights, returns)
+
+def portfolio_vol(weights, covmat):
+    """
+    Weights -> Vol
+    """
+    return np.sqrt(np.dot(weights, np.dot(covmat, weights)))
+
+def _portfolio_vol_and_grad(weights, covmat):
+    """
+    Weights -> Vol and its gradient with respect to the weights,
+    sharing the covmat @ weights product between both
+    """
+    # SLSQP works in float64, only the matrix products use the dtype of covmat
+    weights = weights.astype(covmat.dtype, copy=False)
+    cov_w = np.dot(covmat, weights)
+    vol = np.sqrt(np.dot(weights, cov_w))
+    return float(vol), (cov_w / vol).astype(np.float64, copy=False)
+
+def _cholesky(cov):
+    """
+    Returns the lower Cholesky factor L of cov, i.e. cov = L @ L.T,
+    or None if cov is not positive definite
+    """
+    try:
+        return np.linalg.cholesky(cov)
+    except np.linalg.LinAlgError:
+        return None
+
+def _chol_vol_and_grad(weights, chol):
+    """
+    Weights -> Vol and its gradient with respect to the weights,
+    using the Cholesky factor of the covariance matrix: w.T @ cov @ w == |L.T @ w|**2
+    """
+    weights = weights.astype(chol.dtype, copy=False)
+    y = np.dot(weights, chol)
+    vol = np.sqrt(np.dot(y, y))
+    return float(vol), (np.dot(chol, y) / vol).astype(np.float64, copy=False)
+
+def _vol_objective(cov, chol):
+    """
+    Picks the vol-and-gradient function and its matrix argument for the optimizers,
+    preferring the Cholesky factor when cov is positive definite
+    """
+    if chol is None:
+        chol = _cholesky(cov)
+    if chol is None:
+        return _portfolio_vol_and_grad, cov
+    return _chol_vol_and_grad, chol
+
+def _portfolios_return_vol(weights, er, cov):
+    """
+    Returns and vols of many portfolios at once, one row of weights per portfolio,
+    as a single matrix product instead of one small product per portfolio
+    """
+    rets = np.dot(weights, er)
+    vols = np.sqrt(np.einsum('ij,ij->i', np.dot(weights, cov), weights))
+    return rets, vols
+
+def plot_ef2(er, cov, n_points=25, style='.-'):
+    """
+    Plots the 2-assets eddicient  frontier
+    """
+    if er.shape[0] != 2 or er.shape[0] != 2:
+        raise ValueError("plot_ef2 can only plot 2-asset frontiers")
+    w = np.linspace(0, 1, n_points)
+    weights = np.column_stack([w, 1-w])
+    rets, vols = _portfolios_return_vol(weights, _as_array(er), _as_array(cov))
+    ef = pd.DataFrame({
+        "Returns": rets,
+        "Volatility": vols
+    })
+    return ef.plot.line(x='Volatility', y='Returns', style=style)
+
+@functools.lru_cache(maxsize=None)
+def _quadprog():
+    """
+    Returns the quadprog module, imported on first use, or None if it isn't installed
+    """
+    try:
+        import quadprog
+    except ImportError:
+        return None
+    return quadprog
+
+def _qp_min_vol(target_return, er, cov):
+    """
+    Solves minimize_vol as the quadratic program it is:
+    min w.T @ cov @ w subject to sum(w) == 1, er @ w == target_return and w >= 0
+    Returns None if quadprog isn't installed or can't solve it, e.g. when cov is singular
+    """
+    quadprog = _quadprog()
+    if quadprog is None:
+        return None
+    n = er.shape[0]
+    # quadprog wants constraints as C.T @ w >= b, with the first meq ones as equalities
+    C = np.column_stack([np.ones(n), er, np.eye(n)])
+    b = np.concatenate([[1.0, target_return], np.zeros(n)])
+    try:
+        # quadprog needs a writable G, and cov can be a read-only view of a DataFrame
+        weights = quadprog.solve_qp(np.array(cov, dtype=np.float64), np.zeros(n), C, b, meq=2)[0]
+    except ValueError:
+        return None
+    # clip round-off below zero, then restore the weights-sum-to-1 constraint
+    weights = np.maximum(weights, 0.0)
+    return weights / weights.sum()
+
+def minimize_vol(target_return, er, cov, chol=None):
+    """
+    target_return -> W
+    Solved as a quadratic program with quadprog when it is installed, with SLSQP otherwise
+    chol can be a precomputed Cholesky factor of cov, only used by the SLSQP path
+    """
+    # the constraints are handed to SLSQP as is, so they have to be float64
+    er, cov = _as_array(er, np.float64), _as_array(cov)
+    # _qp_min_vol solves in float64 whatever the dtype of cov,
+    # optimal_weights casts the weights back
+    weights = _qp_min_vol(target_return, er, cov)
+    if weights is not None:
+        return weights
+    vol_and_grad, vol_mat = _vol_objective(cov, chol)
+    n = er.shape[0]
+    init_guess = np.repeat(1/n, n)
+    bounds = ((0.0, 1.0),) * n
+    return_is_target = {
+        'type': 'eq',
+        'args': (er,),
+        'fun': lambda weights, er: target_return - portfolio_return(weights, er),
+        'jac': lambda weights, er: -er
+    }
+    weights_sum_to_1 = {
+        'type': 'eq',
+        'fun': lambda weights: np.sum(weights) - 1,
+        'jac': lambda weights: np.ones_like(weights)
+    }
+    # imported on first use, quadprog usually makes scipy.optimize unnecessary
+    from scipy.optimize import minimize
+    results = minimize(
+        vol_and_grad, 
+        init_guess, 
+        args=(vol_mat,),
+        method='SLSQP',
+        jac=True,
+        options={'disp': False},
+        constraints=(return_is_target, weights_sum_to_1),
+        bounds=bounds
+    )
+    return results.x
+
+
+def _frontier_closed_form(target_rs, er, chol):
+    """
+    Closed-form minimum vol weights for each target return when only the
+    weights-sum-to-1 and return-is-target constraints are imposed
+    chol is the lower Cholesky factor of the covariance matrix
+    Returns an (n_points, n) array, or None if the problem is degenerate
+    """
+    # scipy is imported on first use to keep the toolkit's import time down
+    from scipy.linalg import cho_solve
+    n = er.shape[0]
+    # keep the right-hand side in the dtype of chol so the solve runs in that precision
+    inv_cov_1, inv_cov_er = cho_solve((chol, True), np.column_stack([np.ones(n, dtype=er.dtype), er])).T
+    a = inv_cov_er.sum()
+    b = np.dot(er, inv_cov_er)
+    c = inv_cov_1.sum()
+    d = b*c - a*a
+    if not d > 1e-12 * b * c:
+        return None
+    # every frontier portfolio is a combination of these two fixed portfolios
+    lam = (b - a*target_rs) / d
+    gam = (c*target_rs - a) / d
+    return np.outer(lam, inv_cov_1) + np.outer(gam, inv_cov_er)
+
+def optimal_weights(er, cov, n_points=25, n_jobs=1, dtype=np.float64):
+    """
+    Return a list of weights to run the optimizer on to minimize the vol
+    Targets whose closed-form solution is already long-only are not optimized,
+    the rest are solved with minimize_vol. Those are independent problems, so
+    with n_jobs != 1 they are solved in parallel with joblib (n_jobs=-1 uses all cores)
+    dtype=np.float32 halves the memory traffic of the covariance math,
+    which is plenty of precision to plot a frontier with many assets;
+    the closed-form weights are then float32 too
+    """
+    er, cov = _as_array(er, dtype), _as_array(cov, dtype)
+    target_rs = np.linspace(er.min(), er.max(), n_points, dtype=er.dtype)
+    # factor cov once and share it between the closed form and every optimization
+    chol = _cholesky(cov)
+    weights = None if chol is None else _frontier_closed_form(target_rs, er, chol)
+    if weights is None:
+        weights = [None] * n_points
+        pending = list(range(n_points))
+    else:
+        weights = list(weights)
+        # the long-only bounds bind for these targets
+        pending = [i for i, w in enumerate(weights) if np.any(w < 0)]
+    if n_jobs == 1:
+        solved = [minimize_vol(target_rs[i], er, cov, chol) for i in pending]
+    else:
+        from joblib import Parallel, delayed
+        solved = Parallel(n_jobs=n_jobs)(
+            delayed(minimize_vol)(target_rs[i], er, cov, chol) for i in pending
+        )
+    for i, w in zip(pending, solved):
+        # the optimizers always return float64
+        weights[i] = w.astype(er.dtype, copy=False)
+    return weights
+
+def gmv(cov):
+    """
+    Returns the weight of the Global Minimum Vol portfolio
+    given the covariance matrix
+    """
+    cov = _as_array(cov)
+    n = cov.shape[0]
+    chol = _cholesky(cov)
+    if chol is not None:
+        from scipy.linalg import cho_solve
+        inv_cov_1 = cho_solve((chol, True), np.ones(n, dtype=cov.dtype))
+        w = inv_cov_1 / inv_cov_1.sum()
+        if np.all(w >= 0):
+            return w
+    # the long-only bounds bind, so optimize instead
+    return msr(0, np.repeat(1, n), cov)
+
+def plot_ef(er, cov, n_points=25, riskfree_rate=0, show_cml=False, show_ew=False, show_gmv=False, style='.-', n_jobs=1, dtype=np.float64):
+    """
+    Plots the n-asset efficient frontier
+    """
+    er, cov = _as_array(er, dtype), _as_array(cov, dtype)
+    weights = optimal_weights(er, cov, n_points=n_points, n_jobs=n_jobs, dtype=dtype)
+    rets, vols = _portfolios_return_vol(np.vstack(weights).astype(cov.dtype, copy=False), er, cov)
+    ef = pd.DataFrame({
+        "Returns": rets,
+        "Volatility": vols
+    })
+    ax = ef.plot.line(x='Volatility', y='Returns', style=style)
+    ax.set_title('Efficient Frontier',fontweight ="bold")
+    ax.set_xlabel('Volatility')
+    ax.set_ylabel('Returns')
+    if show_ew:
+        n = er.shape[0]
+        w_ew = np.repeat(1/n, n)
+        r_ew = portfolio_return(w_ew, er)
+        vol_ew = portfolio_vol(w_ew, cov)
+        # Display EW
+        ax.plot([vol_ew], [r_ew], color='goldenrod', marker='o', linestyle='dashed')
+    if show_gmv:
+        w_gmv = gmv(cov)
+        r_gmv = portfolio_return(w_gmv, er)
+        vol_gmv = portfolio_vol(w_gmv, cov)
+        # Display GMV
+        ax.plot([vol_gmv], [r_gmv], color='midnightblue', marker='o', linestyle='dashed')
+    if show_cml:
+        ax.set_xlim(left = 0)
+        w_msr = msr(riskfree_rate, er, cov)
+        r_msr = portfolio_return(w_msr, er)
+        vol_msr = portfolio_vol(w_msr, cov)
+        # Add CML
+        cml_x = [0, vol_msr]
+        cml_y = [riskfree_rate, r_msr]
+        ax.plot(cml_x, cml_y, color='green', marker='o', linestyle='dashed')
+    return ax
+
+
+def msr(riskfree_rate, er, cov):
+    """
+    riskfree_rate, er, cov -> W
+    """
+    er, cov = _as_array(er, np.float64), _as_array(cov)
+    vol_and_grad, vol_mat = _vol_objective(cov, None)
+    n = er.shape[0]
+    init_guess = np.repeat(1/n, n)
+    bounds = ((0.0, 1.0),) * n
+    weights_sum_to_1 = {
+        'type': 'eq',
+        'fun': lambda weights: np.sum(weights) - 1,
+        'jac': lambda weights: np.ones_like(weights)
+    }
+    def neg_sharpe_ratio(weights, riskfree_rate, er, vol_mat):
+        """
+        Returns the negative of sharpe ratio and its gradient,
+        given weights, riskfree_rate, er and cov (or its Cholesky factor)
+        """
+        r = portfolio_return(weights, er)
+        vol, vol_grad = vol_and_grad(weights, vol_mat)
+        excess = r - riskfree_rate
+        # quotient rule on excess/vol
+        return -excess/vol, -(er - excess*vol_grad/vol)/vol
+
+    from scipy.optimize import minimize
+    results = minimize(
+        neg_sharpe_ratio, 
+        init_guess, 
+        args=(riskfree_rate, er, vol_mat),
+        method='SLSQP',
+        jac=True,
+        options={'disp': False},
+        constraints=(weights_sum_to_1),
+        bounds=bounds
+    )
+    return results.x